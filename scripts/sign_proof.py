@@ -1,6 +1,47 @@
 import json
 import sys
 
+# Imported once up front so a long-lived --serve worker pays for it only at startup
+try:
+    from vigil_cryptographicsign import sign_action
+    IMPORT_ERROR = None
+except ImportError as e:
+    sign_action = None
+    IMPORT_ERROR = f"Failed to import vigil_cryptographicsign: {str(e)}"
+except Exception as e:
+    sign_action = None
+    IMPORT_ERROR = f"Failed to sign action: {str(e)}"
+
+
+def serve():
+    # Long-lived mode: one JSON request per stdin line, one JSON response per stdout line
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+
+        request_id = None
+        try:
+            request = json.loads(line)
+            request_id = request.get("id")
+
+            if sign_action is None:
+                output = json.dumps({"id": request_id, "error": IMPORT_ERROR})
+            else:
+                # The proof is nested as text so the caller gets it byte-for-byte
+                proof_json = json.dumps(sign_action(request["payload"]), allow_nan=False)
+                output = json.dumps({"id": request_id, "proof_json": proof_json})
+        except json.JSONDecodeError as e:
+            output = json.dumps({"id": request_id, "error": f"Invalid JSON: {str(e)}"})
+        except Exception as e:
+            output = json.dumps({"id": request_id, "error": f"Failed to sign action: {str(e)}"})
+
+        print(output, flush=True)
+
+
+if len(sys.argv) > 1 and sys.argv[1] == "--serve":
+    serve()
+    sys.exit(0)
+
 try:
     if len(sys.argv) < 2:
         print(json.dumps({"error": "Missing required argument: payload"}), file=sys.stderr)
@@ -8,16 +49,15 @@ try:
     
     payload = json.loads(sys.argv[1])
     
-    from vigil_cryptographicsign import sign_action
+    if sign_action is None:
+        print(json.dumps({"error": IMPORT_ERROR}), file=sys.stderr)
+        sys.exit(1)
     proof = sign_action(payload)
     
     print(json.dumps(proof))
 except json.JSONDecodeError as e:
     print(json.dumps({"error": f"Invalid JSON: {str(e)}"}), file=sys.stderr)
     sys.exit(1)
-except ImportError as e:
-    print(json.dumps({"error": f"Failed to import vigil_cryptographicsign: {str(e)}"}), file=sys.stderr)
-    sys.exit(1)
 except Exception as e:
     print(json.dumps({"error": f"Failed to sign action: {str(e)}"}), file=sys.stderr)
     sys.exit(1)
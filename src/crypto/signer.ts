@@ -0,0 +1,196 @@
+import { spawn, ChildProcess } from 'child_process';
+import { Socket } from 'net';
+import { createInterface } from 'readline';
+import { fileURLToPath } from 'url';
+import { dirname, join } from 'path';
+
+const __dirname = dirname(fileURLToPath(import.meta.url));
+const SIGN_SCRIPT_PATH = join(__dirname, '..', '..', 'scripts', 'sign_proof.py');
+const SIGN_TIMEOUT_MS = 30000;
+const STDERR_TAIL_CHARS = 4096;
+
+interface PendingRequest {
+  payload: unknown;
+  retried: boolean;
+  resolve: (proofJson: string) => void;
+  reject: (error: Error) => void;
+}
+
+// A long-lived `sign_proof.py --serve` process. Requests are written as one
+// JSON line each and matched to their responses by id, so the Python
+// interpreter and signing library are loaded once instead of per call.
+class SignerWorker {
+  private readonly proc: ChildProcess;
+  private readonly pending = new Map<number, PendingRequest>();
+  private nextId = 1;
+  private stderrTail = '';
+  private timer: NodeJS.Timeout | null = null;
+  closed = false;
+
+  constructor() {
+    this.proc = spawn('python3', [SIGN_SCRIPT_PATH, '--serve'], {
+      stdio: ['pipe', 'pipe', 'pipe'],
+    });
+
+    // Keep draining stderr so the worker never blocks on a full pipe, and
+    // hold on to the tail for error messages
+    this.proc.stderr!.setEncoding('utf-8');
+    this.proc.stderr!.on('data', (chunk: string) => {
+      this.stderrTail = (this.stderrTail + chunk).slice(-STDERR_TAIL_CHARS);
+    });
+
+    // One response per line; each line is parsed exactly once
+    createInterface({ input: this.proc.stdout!, crlfDelay: Infinity }).on('line', (line) =>
+      this.handleLine(line)
+    );
+
+    this.proc.stdin!.on('error', (error) => this.close(error));
+    this.proc.on('error', (error) => this.close(error));
+    this.proc.on('exit', (code) => {
+      const error: any = new Error(`sign_proof.py exited with code ${code}`);
+      error.stderr = this.stderrTail;
+      this.close(error);
+    });
+
+    // Don't let an idle signer keep the MCP server alive
+    this.proc.unref();
+    (this.proc.stdin as unknown as Socket).unref();
+    (this.proc.stdout as unknown as Socket).unref();
+    (this.proc.stderr as unknown as Socket).unref();
+  }
+
+  sign(payload: unknown, retried = false): Promise<string> {
+    const id = this.nextId++;
+    return new Promise((resolve, reject) => {
+      this.pending.set(id, { payload, retried, resolve, reject });
+      this.proc.stdin!.write(JSON.stringify({ id, payload }) + '\n');
+      this.armTimer();
+    });
+  }
+
+  kill(): void {
+    this.proc.kill();
+  }
+
+  private handleLine(line: string): void {
+    if (!line.trim()) {
+      return;
+    }
+
+    let message: any;
+    try {
+      message = JSON.parse(line);
+    } catch (error: any) {
+      // Ignore stray output, but a malformed response belongs to the request
+      // being processed; fail it now rather than leaving it to the timeout
+      if (line.trimStart().startsWith('{')) {
+        this.rejectOldest(new Error(`Invalid response from sign_proof.py: ${error.message}`));
+      }
+      return;
+    }
+
+    // Skip notifications and late replies to requests that already timed out
+    const request = this.pending.get(message?.id);
+    if (!request) {
+      return;
+    }
+    this.settle(message.id);
+
+    if (message.error) {
+      request.reject(new Error(message.error));
+    } else {
+      request.resolve(message.proof_json);
+    }
+  }
+
+  private rejectOldest(error: Error): void {
+    const oldest = this.pending.entries().next().value as [number, PendingRequest] | undefined;
+    if (!oldest) {
+      return;
+    }
+    this.settle(oldest[0]);
+    oldest[1].reject(error);
+  }
+
+  private settle(id: number): void {
+    this.pending.delete(id);
+    this.clearTimer();
+    this.armTimer();
+  }
+
+  // The worker signs requests in the order they were written, so only the
+  // oldest pending request is actually being processed. Time that one alone,
+  // so requests queued behind it aren't charged for the wait.
+  private armTimer(): void {
+    if (this.timer || this.closed || this.pending.size === 0) {
+      return;
+    }
+    this.timer = setTimeout(() => this.timeOut(), SIGN_TIMEOUT_MS);
+    this.timer.unref();
+  }
+
+  private clearTimer(): void {
+    if (this.timer) {
+      clearTimeout(this.timer);
+      this.timer = null;
+    }
+  }
+
+  // A request that never answers means the worker is stuck. Fail that request,
+  // kill the worker and hand everything queued behind it to a fresh one, once;
+  // a request that already waited out one hung worker fails instead.
+  private timeOut(): void {
+    this.timer = null;
+    const [hungId, hung] = this.pending.entries().next().value as [number, PendingRequest];
+    this.pending.delete(hungId);
+    const queued = Array.from(this.pending.values());
+    this.pending.clear();
+
+    const error: any = new Error(`Signing timed out after ${SIGN_TIMEOUT_MS}ms`);
+    error.stderr = this.stderrTail;
+    this.close(error);
+    this.proc.kill();
+    if (worker === this) {
+      worker = null;
+    }
+
+    hung.reject(error);
+    for (const request of queued) {
+      if (request.retried) {
+        request.reject(error);
+      } else {
+        getWorker().sign(request.payload, true).then(request.resolve, request.reject);
+      }
+    }
+  }
+
+  private close(error: Error): void {
+    this.closed = true;
+    this.clearTimer();
+    for (const request of this.pending.values()) {
+      request.reject(error);
+    }
+    this.pending.clear();
+  }
+}
+
+let worker: SignerWorker | null = null;
+
+// Resolves with the proof exactly as sign_proof.py serialized it, so callers
+// can pass it through without a lossy parse/stringify round trip
+export function signPayload(payload: unknown): Promise<string> {
+  return getWorker().sign(payload);
+}
+
+function getWorker(): SignerWorker {
+  // Replace the worker if it has exited or hung since the last request
+  if (!worker || worker.closed) {
+    worker = new SignerWorker();
+  }
+  return worker;
+}
+
+export function stopSigner(): void {
+  worker?.kill();
+  worker = null;
+}
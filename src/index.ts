@@ -8,13 +8,35 @@ import {
 } from "@modelcontextprotocol/sdk/types.js";
 import { execFile } from "child_process";
 import { promisify } from "util";
-import { fileURLToPath } from "url";
-import { dirname, join } from "path";
+import { signPayload, stopSigner } from "./crypto/signer.js";
 
 const execFileAsync = promisify(execFile);
-const __filename = fileURLToPath(import.meta.url);
-const __dirname = dirname(__filename);
-const projectRoot = join(__dirname, "..");
+
+// Cap concurrent vigil-scan processes so a burst of tool calls can't exhaust the host
+const scanConcurrency = parseInt(process.env.VYGIL_SCAN_CONCURRENCY || "4", 10);
+const MAX_CONCURRENT_SCANS = Number.isNaN(scanConcurrency) ? 4 : Math.max(1, scanConcurrency);
+let activeScans = 0;
+const scanQueue: Array<() => void> = [];
+
+async function runVigilScan(args: string[]) {
+  if (activeScans < MAX_CONCURRENT_SCANS) {
+    activeScans++;
+  } else {
+    await new Promise<void>((resolve) => scanQueue.push(resolve));
+  }
+
+  try {
+    return await execFileAsync("vigil-scan", args);
+  } finally {
+    // Hand the slot straight to the next waiting scan, if any
+    const next = scanQueue.shift();
+    if (next) {
+      next();
+    } else {
+      activeScans--;
+    }
+  }
+}
 
 // Type definitions for scan results
 interface ScanResult {
@@ -196,28 +218,24 @@ server.setRequestHandler(CallToolRequestSchema, async (request) => {
     }
 
     try {
-      const { stdout, stderr } = await execFileAsync("vigil-scan", cmdArgs);
+      const { stdout, stderr } = await runVigilScan(cmdArgs);
       const scanResult = parseScanOutput(stdout, target === "host" ? "localhost" : repo_url || "unknown");
 
       // If this is a signed scan, sign the results
       if (name === "vygil.scan.signed") {
         try {
-          const scriptPath = join(projectRoot, "scripts", "sign_proof.py");
-          const { stdout: signedOutput } = await execFileAsync("python3", [
-            scriptPath,
-            JSON.stringify({ 
-              payload: scanResult, 
-              purpose: "scan_verification",
-              scan_metadata: {
-                tool: "vigil-scan",
-                target,
-              }
-            }),
-          ]);
+          const proofJson = await signPayload({ 
+            payload: scanResult, 
+            purpose: "scan_verification",
+            scan_metadata: {
+              tool: "vigil-scan",
+              target,
+            }
+          });
 
           const signedResult = {
             scan_result: scanResult,
-            cryptographic_proof: JSON.parse(signedOutput),
+            cryptographic_proof: JSON.parse(proofJson),
             is_tamper_evident: true,
           };
 
@@ -293,17 +311,13 @@ server.setRequestHandler(CallToolRequestSchema, async (request) => {
     };
 
     try {
-      const scriptPath = join(projectRoot, "scripts", "sign_proof.py");
-      const { stdout, stderr } = await execFileAsync("python3", [
-        scriptPath,
-        JSON.stringify({ payload, purpose }),
-      ]);
+      const proofJson = await signPayload({ payload, purpose });
 
       return {
         content: [
           {
             type: "text",
-            text: stdout,
+            text: proofJson,
           },
         ],
       };
@@ -345,5 +359,7 @@ server.setRequestHandler(CallToolRequestSchema, async (request) => {
   };
 });
 
+server.onclose = () => stopSigner();
+
 const transport = new StdioServerTransport();
 await server.connect(transport);